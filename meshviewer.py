@@ -18,6 +18,7 @@ try:
 except ImportError:
     import Tkinter as tk
 
+import functools
 import importlib.util
 import logging
 import pathlib
@@ -25,12 +26,12 @@ import subprocess
 import time
 import tkinter.font as tkfont
 import tkinter.ttk as ttk
-from collections import defaultdict
-from datetime import datetime, timedelta
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Timer
 from tkinter.filedialog import askopenfilename
 
 import vispy
+import vispy.geometry
 import vispy.scene
 from solid2 import scad_render_to_file
 from watchdog.events import DirDeletedEvent, FileModifiedEvent, LoggingEventHandler
@@ -44,11 +45,9 @@ import sys
 
 import numpy as np
 
-# polling reload on the UI
-UI_RELOAD_TIME = 1000
-
-# prevent re-reloading a file if watchdog decides to notify us twice for one edit
-MINIMUM_RELOAD_TIME = timedelta(milliseconds=UI_RELOAD_TIME)
+# wait this long (in seconds) after the last change before reloading a file, so
+# an edit notified more than once (or a burst of saves) reloads it only once
+RELOAD_DEBOUNCE_TIME = 0.3
 
 
 if os.name == "nt":
@@ -60,6 +59,103 @@ if os.name == "nt":
         pass  # this will fail on Windows Server and maybe early Windows
 
 
+# marks free slots in the edge hash table, no real edge packs to this value
+_EMPTY_EDGE = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def _unique_edges_kernel(faces):
+    """
+    Return an (n_edges, 2) array with the unique edges of faces.
+
+    Each edge is packed as (low << 32) | high into a uint64 key and inserted
+    in an open addressing hash table, so duplicates are dropped in a single
+    pass. Only worth it when compiled with numba.
+    """
+    n_faces, n_verts = faces.shape
+    n_edges = n_faces * n_verts
+    bits = 1
+    while (1 << bits) < 2 * n_edges:
+        bits += 1
+    mask = (1 << bits) - 1
+    shift = np.uint64(32 - bits)
+    table = np.empty(1 << bits, dtype=np.uint64)
+    table[:] = _EMPTY_EDGE
+    edges = np.empty((n_edges, 2), dtype=np.uint32)
+    count = 0
+    for f in range(n_faces):
+        for k in range(n_verts):
+            iv = np.uint64(faces[f, k])
+            jv = np.uint64(faces[f, (k + 1) % n_verts])
+            if iv > jv:
+                iv, jv = jv, iv
+            key = (iv << np.uint64(32)) | jv
+            # 32 bit multiplicative hash of both vertices, keeping the high bits.
+            # The products fit in 64 bits, so nothing overflows.
+            h = (iv * np.uint64(0x9E3779B1)) ^ (jv * np.uint64(0x85EBCA77))
+            slot = np.int64((h & np.uint64(0xFFFFFFFF)) >> shift)
+            while table[slot] != _EMPTY_EDGE and table[slot] != key:
+                slot = (slot + 1) & mask
+            if table[slot] == _EMPTY_EDGE:
+                table[slot] = key
+                edges[count, 0] = iv
+                edges[count, 1] = jv
+                count += 1
+
+    return edges[:count]
+
+
+@functools.cache
+def _unique_edges_jit():
+    """
+    Return the numba compiled edge kernel, or None if numba isn't installed.
+
+    numba is optional and slow to import, so it is only loaded on first use.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    return njit(cache=True)(_unique_edges_kernel)
+
+
+# one record per triangle in a binary STL, after the 80 byte header and count
+BINARY_STL_DTYPE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+
+def parse_binary_stl(data):
+    """
+    Parse binary STL bytes into (vertices, faces) arrays.
+
+    Raises ValueError if the data doesn't have the size of a binary STL, which
+    is the only reliable way to tell it apart from an ASCII one.
+    """
+    if len(data) < 84:
+        raise ValueError("Not a binary STL")
+    n_triangles = int(np.frombuffer(data, dtype="<u4", count=1, offset=80)[0])
+    if len(data) != 84 + n_triangles * BINARY_STL_DTYPE.itemsize:
+        raise ValueError("Not a binary STL")
+    triangles = np.frombuffer(
+        data, dtype=BINARY_STL_DTYPE, count=n_triangles, offset=84
+    )
+    vertices = triangles["vertices"].reshape(-1, 3)
+    faces = np.arange(3 * n_triangles, dtype=np.uint32).reshape(-1, 3)
+
+    return vertices, faces
+
+
+def is_triangle_soup(vertices, faces):
+    """
+    Return True when faces don't share any vertex, as in STL files where
+    every triangle stores its own three vertices.
+    """
+    return faces.size == len(vertices) and np.array_equal(
+        faces.reshape(-1), np.arange(len(vertices))
+    )
+
+
 class Model:
     def __init__(self, file_name=None):
         self.data = []
@@ -102,59 +198,110 @@ class Model:
 
     def load_file(self, file_name):
         """Load mesh from file"""
+        self.data.append(self.read_file(file_name))
+
+    @staticmethod
+    def read_file(file_name):
+        """Read a Mesh from file. It doesn't touch the model, so it is thread safe."""
+        if pathlib.Path(file_name).suffix.lower() == ".stl":
+            try:
+                vertices, faces = parse_binary_stl(pathlib.Path(file_name).read_bytes())
+            except ValueError:
+                pass  # ASCII STL, let vispy handle it
+            else:
+                return Model.build_mesh(vertices, faces)
         vertices, faces, _, _ = vispy.io.read_mesh(file_name)
-        self.data.append(Mesh(vertices, faces))
+        return Model.build_mesh(vertices, faces)
 
-    def get_bounding_box(self):
-        bbox = self.data[0].bounding_box
-        for mesh in self.data[1:]:
-            for i in range(len(bbox)):
-                x_i = mesh.bounding_box[i]
-                bbox[i][0] = min([bbox[i][0], min(x_i)])
-                bbox[i][1] = max([bbox[i][1], max(x_i)])
+    @staticmethod
+    def build_mesh(vertices, faces):
+        """Build a Mesh from in-memory arrays"""
+        vertices, faces = np.asarray(vertices), np.asarray(faces)
+        # STL (and OpenSCAD) models are mostly flat CAD faces, shade them per
+        # face instead of smoothing normals across their sharp edges
+        shading = "flat" if is_triangle_soup(vertices, faces) else "smooth"
+        return Mesh(vertices, faces, shading=shading)
 
-        return bbox
+    def get_bounding_box(self):
+        bboxes = np.stack([mesh.bounding_box for mesh in self.data])
+        return np.stack(
+            [bboxes[..., 0].min(axis=0), bboxes[..., 1].max(axis=0)], axis=1
+        )
 
 
 class Mesh:
-    def __init__(self, vertices, faces):
-        self.vertices = vertices
-        self.faces = faces
-        self.bounding_box = self.get_bounding_box()
+    def __init__(self, vertices, faces, shading="smooth"):
+        # use contiguous buffers in the native GPU formats, so neither numpy
+        # nor the VBO upload have to move 64-bit or strided values around
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.faces = np.ascontiguousarray(faces, dtype=np.uint32)
+        self.shading = shading
+        self._bounding_box = None
+        self._wire_segments = None
+        self._mesh_data = None
+
+    def get_mesh_data(self):
+        """
+        Return the vispy MeshData for this mesh.
 
-    def get_vertices(self):
-        vertices = []
-        for face in self.faces:
-            vertices.append([self.vertices[ivt] for ivt in face])
+        MeshData caches the normals needed for shading, so keeping a single
+        instance avoids recomputing them on every plot.
+        """
+        if self._mesh_data is None:
+            self._mesh_data = vispy.geometry.MeshData(
+                vertices=self.vertices, faces=self.faces
+            )
 
-        return vertices
+        return self._mesh_data
+
+    def get_vertices(self):
+        """Return an (n_faces, verts_per_face, n_dims) array of face vertices"""
+        return self.vertices[self.faces]
 
     def get_line_segments(self):
-        line_segments = set()
-        for face in self.faces:
-            for i in range(len(face)):
-                iv = face[i]
-                jv = face[(i + 1) % len(face)]
-                if jv > iv:
-                    edge = (iv, jv)
-                else:
-                    edge = (jv, iv)
-
-                line_segments.add(edge)
-
-        return [
-            [self.vertices[edge[0] - 1], self.vertices[edge[1] - 1]]
-            for edge in line_segments
-        ]
+        """Return an (n_edges, 2, n_dims) array with the unique edges of the mesh"""
+        unique_edges = _unique_edges_jit()
+        if unique_edges is not None:
+            return self.vertices[unique_edges(self.faces)]
 
-    def get_bounding_box(self):
-        v = [vti for face in self.get_vertices() for vti in face]
-        bbox = []
-        for i in range(len(self.vertices[0])):
-            x_i = [p[i] for p in v]
-            bbox.append([min(x_i), max(x_i)])
+        faces = np.asarray(self.faces)
+        edges = np.stack([faces, np.roll(faces, -1, axis=1)], axis=2).reshape(-1, 2)
+        edges.sort(axis=1)
+        edges = np.unique(edges, axis=0)
+
+        return self.vertices[edges]
+
+    def get_wire_segments(self):
+        """
+        Return an (n_faces * verts_per_face, 2) array of vertex indices, one
+        row per face edge, as used by the wireframe view.
+
+        Faces don't change once the mesh is built, so the result is cached.
+        """
+        if self._wire_segments is None:
+            self._wire_segments = np.stack(
+                [self.faces, np.roll(self.faces, -1, axis=1)], axis=2
+            ).reshape(-1, 2)
+
+        return self._wire_segments
 
-        return bbox
+    @property
+    def bounding_box(self):
+        """Bounding box of the mesh, only computed when first needed"""
+        if self._bounding_box is None:
+            self._bounding_box = self.get_bounding_box()
+
+        return self._bounding_box
+
+    def get_bounding_box(self):
+        """Return an (n_dims, 2) array with the [min, max] of each axis"""
+        # reduce over contiguous per axis copies instead of striding through
+        # self.vertices, they are only kept for the duration of the call
+        axes = (
+            np.ascontiguousarray(self.vertices[:, i])
+            for i in range(self.vertices.shape[1])
+        )
+        return np.array([[x_i.min(), x_i.max()] for x_i in axes])
 
 
 class View:
@@ -164,6 +311,9 @@ class View:
         self.model = model
         self.canvas = None
         self.vpview = None
+        self.visuals = []
+        self.plot_types = None
+        self.fit_on_plot = False
 
     def clear(self):
         if self.vpview is not None:
@@ -171,36 +321,62 @@ class View:
 
         self.vpview = self.canvas.central_widget.add_view(bgcolor="white")
         vispy.scene.visuals.XYZAxis(parent=self.vpview.scene)
+        self.vpview.camera = vispy.scene.TurntableCamera(parent=self.vpview.scene)
+        self.visuals = []
+        self.plot_types = None
+        # the camera was framed before anything was plotted in the new view
+        self.fit_on_plot = True
 
     def plot(self, types="solid + wireframe"):
-        self.clear()
+        """
+        Plot the model, reusing the visuals (and their GPU buffers) and the
+        camera of the previous plot when possible. Visuals are only recreated
+        when the plot types or the number of meshes change.
+        """
         if isinstance(types, (str,)):
             types = [s.strip() for s in types.split("+")]
 
-        for mesh in self.model.data:
+        if any(type not in ("solid", "wireframe") for type in types):
+            # Unknown plot type
+            return None
+
+        if self.vpview is None:
+            self.clear()
+
+        if types != self.plot_types or len(self.visuals) != len(self.model.data):
+            for visuals in self.visuals:
+                for visual in visuals.values():
+                    visual.parent = None
+            self.visuals = [{} for _ in self.model.data]
+            self.plot_types = types
+
+        for mesh, visuals in zip(self.model.data, self.visuals):
             for type in types:
+                visual = visuals.get(type)
                 if type == "solid":
-                    msh = vispy.scene.visuals.Mesh(
-                        vertices=mesh.vertices, shading="smooth", faces=mesh.faces
-                    )
-                    self.vpview.add(msh)
+                    if visual is None:
+                        visual = vispy.scene.visuals.Mesh(
+                            meshdata=mesh.get_mesh_data(), shading=mesh.shading
+                        )
+                        self.vpview.add(visual)
+                    else:
+                        visual.set_data(meshdata=mesh.get_mesh_data())
+                        visual.shading = mesh.shading
 
                 elif type == "wireframe":
-                    n_faces = len(mesh.faces)
-                    ix = np.tile([0, 1, 1, 2, 2, 0], n_faces) + np.repeat(
-                        np.arange(0, 3 * n_faces, 3), 6
-                    )
-                    edges = mesh.faces.reshape(-1)[ix]
-                    edg = vispy.scene.visuals.Line(
-                        pos=mesh.vertices[edges], connect="segments"
-                    )
-                    self.vpview.add(edg)
+                    segments = mesh.get_wire_segments()
+                    pos = mesh.vertices[segments].reshape(-1, mesh.vertices.shape[1])
+                    if visual is None:
+                        visual = vispy.scene.visuals.Line(pos=pos, connect="segments")
+                        self.vpview.add(visual)
+                    else:
+                        visual.set_data(pos=pos)
 
-                else:
-                    # Unknown plot type
-                    return None
+                visuals[type] = visual
 
-        self.vpview.camera = vispy.scene.TurntableCamera(parent=self.vpview.scene)
+        if self.fit_on_plot:
+            self.fit_on_plot = False
+            self.fit()
 
     def xy(self):
         self.vpview.camera.elevation = 90
@@ -220,18 +396,31 @@ class View:
     def reset(self):
         self.vpview.camera.reset()
 
+    def fit(self):
+        """Frame the whole scene, and make that the view restored by reset()"""
+        self.vpview.camera.set_range()
+        self.vpview.camera.set_default_state()
+
 
 class Controller:
     def __init__(self, view=None, file_name=None):
-        default_handler = self.DefaultFileHandler(self)
-        self.file_handlers = defaultdict(lambda: default_handler)
-        self.file_handlers[".py"] = self.PythonFileHandler(self)
-        self.file_handlers[".scad"] = self.ScadFileHandler(self)
+        # a single observer is shared by all the file handlers, they only
+        # swap the watched directory when a new file is opened
+        self.observer = Observer()
+        self.observer.start()
+        # parses files off the Tk main loop, a single worker keeps reloads in order
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.closing = False
+        # the file opened by the user, framed once its first load is shown
+        self.fit_file = None
+        self.default_file_handler = self.DefaultFileHandler(self)
+        self.file_handlers = {
+            ".py": self.PythonFileHandler(self),
+            ".scad": self.ScadFileHandler(self),
+        }
         root = tk.Tk()
         root.geometry("600x550")
         root.title("Mesh Viewer")
-        self.reload_lock = Lock()
-        self.reload_file = None
 
         if view is None:
             view = View()
@@ -281,14 +470,15 @@ class Controller:
         self.root = root
         self.view = view
         self.model = view.model
-        self.root_frame = f1
         view.plot()
 
     def render(self):
         self.root.mainloop()
 
     def get_file_handler(self, path):
-        return self.file_handlers[pathlib.Path(path).suffix]
+        return self.file_handlers.get(
+            pathlib.Path(path).suffix, self.default_file_handler
+        )
 
     def open(self):
         file_name = askopenfilename(
@@ -299,35 +489,71 @@ class Controller:
                 ("all files", "*.*"),
             ),
         )
+        if file_name:
+            self.open_file(file_name)
+
+    def open_file(self, file_name):
+        # watchdog reports absolute paths for an absolute watch, so use the same
+        # form everywhere, otherwise a bare name from the command line would
+        # never match the modified file
+        file_name = os.path.abspath(file_name)
+        # a new file likely has a different size, frame it once it's loaded.
+        # Reloads keep the camera where the user left it.
+        self.fit_file = file_name
         self.file_handler = self.get_file_handler(file_name)
+        # mesh files are parsed in the background, but .py and .scad files are
+        # still converted by openscad right here, on the Tk thread
         self.file_handler.reload(file_name)
         # Start observing file for changes after loading it, to avoid a double reload
         self.file_handler.follow(file_name)
-        # start the loop that checks if we have to reload
-        self.file_reloader()
 
-    def file_reloader(self):
-        """
-        This code executes in the main thread thanks to frame.after().
-        The observer will signal us to reload the model, because doing
-        it from the observer's thread breaks vispy.
+    def load_file_in_viewer(self, file_handle):
+        self.load_in_background(file_handle, Model.read_file, file_handle)
+
+    def load_mesh_in_viewer(self, vertices, faces, source_file):
+        self.load_in_background(source_file, Model.build_mesh, vertices, faces)
+
+    def load_in_background(self, source_file, build_mesh, *args):
         """
-        if self.reload_lock.acquire(blocking=False):
-            if self.reload_file:
-                print("Processing reload signal")
-                self.load_file_in_viewer(self.reload_file)
-            self.reload_file = None
-            self.reload_lock.release()
-        self.root_frame.after(UI_RELOAD_TIME, self.file_reloader)
+        Build the mesh on the worker thread, so large files don't freeze the UI,
+        and show it from the Tk main loop once it's ready.
 
-    def load_file_in_viewer(self, file_handle):
+        source_file is the file the user opened, which the mesh comes from.
+        """
+        future = self.executor.submit(build_mesh, *args)
+        future.add_done_callback(lambda f: self.schedule_show_mesh(f, source_file))
+
+    def schedule_show_mesh(self, future, source_file):
+        # runs on the worker thread. A job that was already running when the
+        # app exited still completes, and by then the Tk root is gone.
+        if self.closing:
+            return
+        try:
+            self.root.after_idle(self.show_mesh, future, source_file)
+        except (tk.TclError, RuntimeError):
+            pass  # the root was destroyed between the check and the call
+
+    def show_mesh(self, future, source_file):
+        try:
+            mesh = future.result()
+        except Exception:
+            logging.exception("Failed to load mesh")
+            return
         self.model.clear()
-        self.model.load_file(file_handle)
+        self.model.data.append(mesh)
         self.view.plot(self.view_mode_var.get())
+        # compare with the source, so an in-flight reload of the previously
+        # opened file doesn't take the framing meant for the new one
+        if source_file == self.fit_file:
+            self.fit_file = None
+            self.view.fit()
 
     def exit(self):
-        if hasattr(self, 'file_handler'):
-            self.file_handler.stop()
+        self.closing = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # don't join the observer: its thread may be waiting on this (Tk)
+        # thread to run an after_idle call, and it's a daemon thread anyway
+        self.observer.stop()
         self.model.clear()
         self.view.clear()
         self.root.destroy()
@@ -336,11 +562,11 @@ class Controller:
         def __init__(self, controller):
             super().__init__()
             self.controller = controller
-            self.observer = None
             self.observed_file = None
             self.observed_path = None
             self.observer_watch = None
-            self.last_reload = None
+            self.reload_timer = None
+            self.reload_lock = Lock()
 
         def follow(self, observed_file):
             """
@@ -348,27 +574,18 @@ class Controller:
 
             Following the file didn't work since sometimes it got deleted and replaced,
             which broke the internal observer state and forced me to re-create it.
+            The directory watch survives that, so the controller's observer is
+            reused and only the previous watch (from any handler) is dropped.
             """
-            if self.observer:
-                self.observer.unschedule(self.observed_file)
-                self.observer.stop()
-                self.observer.join()
-            self.observer = Observer()
+            observer = self.controller.observer
+            observer.unschedule_all()
             self.observed_file = observed_file
             self.observed_path = pathlib.Path(observed_file).parents[0]
-            self.observer_watch = None
-            self.observer_watch = self.observer.schedule(
+            self.observer_watch = observer.schedule(
                 self, self.observed_path, recursive=False
             )
-            self.observer.start()
-            self.last_reload = datetime.now()
             self.logger.info("Following %s", self.observed_path)
 
-        def stop(self):
-            if self.observer:
-                self.observer.stop()
-                self.observer.join()
-
         def reload(self):
             """
             File dependent implementation
@@ -378,11 +595,13 @@ class Controller:
     class DefaultFileHandler(BaseFileHandler):
         @override
         def reload(self, file_path):
-            # By default just load the file in the viewer
-            if self.controller.reload_lock.acquire(blocking=True):
-                self.logger.info("Sending reload signal")
-                self.controller.reload_file = file_path
-                self.controller.reload_lock.release()
+            # By default just load the file in the viewer. This may be called
+            # from the observer's thread, and loading the model there breaks
+            # vispy, so hand it over to the Tk main loop instead.
+            self.logger.info("Sending reload signal")
+            self.controller.root.after_idle(
+                self.controller.load_file_in_viewer, file_path
+            )
 
         @override
         def on_modified(self, event):
@@ -391,24 +610,63 @@ class Controller:
                 isinstance(event, FileModifiedEvent)
                 and event.src_path == self.observed_file
             ):
-                # log the event and reload the file
-                now = datetime.now()
-                if now - self.last_reload > MINIMUM_RELOAD_TIME:
-                    self.last_reload = now
-                    self.reload(event.src_path)
+                # (re)start the countdown, so the file is reloaded once after
+                # the last change instead of dropping the changes that follow
+                # the first one
+                if self.reload_timer is not None:
+                    self.reload_timer.cancel()
+                self.reload_timer = Timer(
+                    RELOAD_DEBOUNCE_TIME, self.debounced_reload, [event.src_path]
+                )
+                self.reload_timer.daemon = True
+                self.reload_timer.start()
+
+        def debounced_reload(self, file_path):
+            # runs on the timer's thread. An uncaught error would only be
+            # printed, so log it like the rest, and don't let a slow reload
+            # overlap the next one.
+            with self.reload_lock:
+                if self.controller.closing:
+                    return
+                try:
+                    self.reload(file_path)
+                except Exception:
+                    self.logger.exception("Failed to reload %s", file_path)
 
     class ScadFileHandler(DefaultFileHandler):
         @override
         def reload(self, file_path):
-            # call openscad and generate an stl, then load the stl
-            file_handle = pathlib.Path(file_path)
-            new_file = file_handle.with_stem("solidpython_temp").with_suffix(".stl")
+            self.render_scad(file_path, file_path)
+
+        def render_scad(self, file_path, source_file):
+            # call openscad to write a binary stl to stdout, and load it from
+            # memory instead of going through a temporary file
+            args = ["-o", "-", "--export-format", "binstl", file_path]
             try:
-                subprocess.run(["openscad", "-o", new_file, file_path])
+                result = subprocess.run(["openscad", *args], capture_output=True)
             except FileNotFoundError as _:
-                subprocess.run(["openscad-nightly", "-o", new_file, file_path])
-            self.logger.info(f"Converted scad file to {new_file}")
-            super().reload(new_file)
+                try:
+                    result = subprocess.run(
+                        ["openscad-nightly", *args], capture_output=True
+                    )
+                except FileNotFoundError as _:
+                    self.logger.error("OpenSCAD not found, can't convert %s", file_path)
+                    return
+            if result.returncode != 0:
+                self.logger.error(
+                    "Failed to convert %s: %s", file_path, result.stderr.decode()
+                )
+                return
+            try:
+                vertices, faces = parse_binary_stl(result.stdout)
+            except ValueError as e:
+                self.logger.error("Failed to convert %s: %s", file_path, e)
+                return
+            self.logger.info(f"Converted scad file {file_path}")
+            # see DefaultFileHandler.reload
+            self.controller.root.after_idle(
+                self.controller.load_mesh_in_viewer, vertices, faces, source_file
+            )
 
     class PythonFileHandler(ScadFileHandler):
         @override
@@ -427,7 +685,7 @@ class Controller:
                 file_header=f"$fn = {foo.solidpython_segments};",
             )
             self.logger.info(f"Converted python file to {new_file}. Reloading STL...")
-            super().reload(new_file)
+            self.render_scad(new_file, file_path)
 
 
 def setMaxWidth(stringList, element):
@@ -456,7 +714,8 @@ class App:
             file_name = sys.argv[1]
 
         if model is None:
-            model = Model(file_name)
+            # the file is loaded by the controller, without blocking the UI
+            model = Model()
 
         if view is None:
             view = View(model)
@@ -464,6 +723,9 @@ class App:
         if controller is None:
             controller = Controller(view, file_name)
 
+        if file_name is not None:
+            controller.open_file(file_name)
+
         self.model = model
         self.view = view
         self.controller = controller